@@ -0,0 +1,209 @@
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"sort"
+	"strconv"
+	"sync"
+)
+
+// scanCacheVersion is mixed into every cache key; bump it when the scan output format changes.
+const scanCacheVersion = "1"
+
+// scanCacheEntry holds the issues found in one previously scanned staged blob.
+type scanCacheEntry struct {
+	PatternIssues []string `json:"patternIssues"`
+	EnvIssues     []string `json:"envIssues"`
+	LastUsed      int64    `json:"lastUsed"` // logical clock, increasing across runs
+}
+
+// scanCache remembers the issues found in previously scanned staged blobs, so re-running
+// the hook over unchanged content (amends, retried commits) skips reading and scanning it.
+// Keys cover the file path, blob OID, the running executable, secret patterns and .env values,
+// so any change to what a scan would report misses the cache, including a new build. Cache
+// I/O is best-effort: a missing or corrupt cache file only means every file is scanned.
+type scanCache struct {
+	mu      sync.Mutex
+	path    string
+	salt    string
+	entries map[string]*scanCacheEntry
+	clock   int64
+	dirty   bool
+}
+
+// scanCacheDirEnv names the environment variable that overrides the scan cache directory.
+const scanCacheDirEnv = "SECURITY_HOOKS_CACHE_DIR"
+
+// scanCachePath returns the cache file location: in $SECURITY_HOOKS_CACHE_DIR if set, otherwise
+// under the user cache directory, or "" if there is none.
+func scanCachePath() string {
+	if dir := os.Getenv(scanCacheDirEnv); dir != "" {
+		return filepath.Join(dir, "scan-cache.json")
+	}
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "security-hooks", "scan-cache.json")
+}
+
+// loadScanCache reads the cache file at path. An empty path gives an in-memory cache that is
+// never saved, as does an executable that cannot be identified: results from another build
+// must not be trusted.
+func loadScanCache(path string, secretEnvValues map[string]string) *scanCache {
+	identity, err := executableIdentity()
+	if err != nil {
+		path = ""
+	}
+	cache := &scanCache{
+		path:    path,
+		salt:    scanCacheSalt(identity, secretEnvValues),
+		entries: make(map[string]*scanCacheEntry),
+	}
+
+	if path == "" {
+		return cache
+	}
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return cache
+	}
+	if err := json.Unmarshal(data, &cache.entries); err != nil || cache.entries == nil {
+		cache.entries = make(map[string]*scanCacheEntry)
+	}
+	for key, entry := range cache.entries {
+		if entry == nil {
+			delete(cache.entries, key)
+			continue
+		}
+		cache.clock = max(cache.clock, entry.LastUsed)
+	}
+
+	return cache
+}
+
+// executableIdentity identifies the running executable by its path, size and modification
+// time. Scan results depend on code as well as patterns (keyword prefilters, probes, boundary
+// checks, size limits), so every build gets its own cache keys; a rebuild or reinstall
+// changes the modification time. A stat keeps this cheap, where hashing the binary would
+// cost more per run than a warm cache saves on a small commit.
+func executableIdentity() (string, error) {
+	path, err := os.Executable()
+	if err != nil {
+		return "", err
+	}
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", err
+	}
+	return path + "\x00" + strconv.FormatInt(info.Size(), 10) + "\x00" + strconv.FormatInt(info.ModTime().UnixNano(), 10), nil
+}
+
+// scanCacheSalt digests everything besides the blob itself that affects scan results.
+func scanCacheSalt(identity string, secretEnvValues map[string]string) string {
+	h := sha256.New()
+	h.Write([]byte(scanCacheVersion + "\x00" + identity + "\x00"))
+	for _, sp := range secretPatterns {
+		h.Write([]byte(sp.Pattern.String() + "\x00" + sp.Description + "\x00"))
+	}
+
+	keys := make([]string, 0, len(secretEnvValues))
+	for key := range secretEnvValues {
+		keys = append(keys, key)
+	}
+	sort.Strings(keys)
+	for _, key := range keys {
+		h.Write([]byte(key + "\x00" + secretEnvValues[key] + "\x00"))
+	}
+
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+// key derives the cache key for a file path and its staged blob.
+func (c *scanCache) key(filePath string, blob StagedBlob) string {
+	sum := sha256.Sum256([]byte(c.salt + "\x00" + filePath + "\x00" + blob.OID))
+	return hex.EncodeToString(sum[:])
+}
+
+// get returns the cached issues for a file path and its staged blob. A hit refreshes the
+// entry's recency in memory only, so a run served entirely from the cache does not rewrite it.
+func (c *scanCache) get(filePath string, blob StagedBlob) (fileIssues, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	entry, ok := c.entries[c.key(filePath, blob)]
+	if !ok {
+		return fileIssues{}, false
+	}
+	c.clock++
+	entry.LastUsed = c.clock
+
+	return fileIssues{patternIssues: entry.PatternIssues, envIssues: entry.EnvIssues}, true
+}
+
+// put records the issues found for a file path and its staged blob.
+func (c *scanCache) put(filePath string, blob StagedBlob, issues fileIssues) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	c.clock++
+	c.entries[c.key(filePath, blob)] = &scanCacheEntry{
+		PatternIssues: issues.patternIssues,
+		EnvIssues:     issues.envIssues,
+		LastUsed:      c.clock,
+	}
+	c.dirty = true
+}
+
+// save evicts the least recently used entries beyond MaxScanCacheEntries and writes the
+// cache file atomically, if any entry was added. Errors are ignored.
+func (c *scanCache) save() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if c.path == "" || !c.dirty {
+		return
+	}
+
+	if len(c.entries) > MaxScanCacheEntries {
+		keys := make([]string, 0, len(c.entries))
+		for key := range c.entries {
+			keys = append(keys, key)
+		}
+		sort.Slice(keys, func(i, j int) bool {
+			return c.entries[keys[i]].LastUsed > c.entries[keys[j]].LastUsed
+		})
+		for _, key := range keys[MaxScanCacheEntries:] {
+			delete(c.entries, key)
+		}
+	}
+
+	data, err := json.Marshal(c.entries)
+	if err != nil {
+		return
+	}
+
+	dir := filepath.Dir(c.path)
+	if err := os.MkdirAll(dir, 0o700); err != nil {
+		return
+	}
+	tmp, err := os.CreateTemp(dir, "scan-cache-*.json")
+	if err != nil {
+		return
+	}
+	defer func() { _ = os.Remove(tmp.Name()) }()
+
+	if _, err := tmp.Write(data); err != nil {
+		_ = tmp.Close()
+		return
+	}
+	if err := tmp.Close(); err != nil {
+		return
+	}
+	_ = os.Rename(tmp.Name(), c.path)
+	c.dirty = false
+}
@@ -0,0 +1,136 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"reflect"
+	"runtime"
+	"testing"
+)
+
+func Test_ScanCache_RoundTrip(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "security-hooks", "scan-cache.json")
+	env := map[string]string{"API_KEY": "supersecretvalue"}
+	blob := StagedBlob{OID: "0123456789abcdef0123456789abcdef01234567", Size: 42}
+	want := fileIssues{
+		patternIssues: []string{"app.py:3 - Found potential Anthropic API key"},
+		envIssues:     []string{"app.py:5 - Found hardcoded value from .env key 'API_KEY'"},
+	}
+
+	cache := loadScanCache(path, env)
+	if _, ok := cache.get("app.py", blob); ok {
+		t.Fatal("expected miss on empty cache")
+	}
+	cache.put("app.py", blob, want)
+	cache.save()
+
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("expected cache file to be written: %v", err)
+	}
+	// Windows reports 0666 for any writable file
+	if perm := info.Mode().Perm(); runtime.GOOS != "windows" && perm != 0o600 {
+		t.Errorf("cache file permissions = %o, want 600", perm)
+	}
+
+	reloaded := loadScanCache(path, env)
+	got, ok := reloaded.get("app.py", blob)
+	if !ok {
+		t.Fatal("expected hit after reload")
+	}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("cached issues = %+v, want %+v", got, want)
+	}
+	// A run served entirely from the cache leaves the file alone
+	if reloaded.dirty {
+		t.Error("expected a cache hit not to mark the cache for saving")
+	}
+
+	// Same blob at another path is a different entry: issues embed the path
+	if _, ok := reloaded.get("other.py", blob); ok {
+		t.Error("expected miss for a different path")
+	}
+}
+
+func Test_ScanCachePath_EnvOverride(t *testing.T) {
+	dir := t.TempDir()
+	t.Setenv(scanCacheDirEnv, dir)
+
+	if got, want := scanCachePath(), filepath.Join(dir, "scan-cache.json"); got != want {
+		t.Errorf("scanCachePath() = %q, want %q", got, want)
+	}
+}
+
+func Test_ScanCache_EnvChangeInvalidates(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "scan-cache.json")
+	blob := StagedBlob{OID: "0123456789abcdef0123456789abcdef01234567", Size: 42}
+
+	cache := loadScanCache(path, map[string]string{"API_KEY": "supersecretvalue"})
+	cache.put("app.py", blob, fileIssues{})
+	cache.save()
+
+	changed := loadScanCache(path, map[string]string{"API_KEY": "anothersecretvalue"})
+	if _, ok := changed.get("app.py", blob); ok {
+		t.Error("expected miss after .env values changed")
+	}
+}
+
+func Test_ScanCacheSalt_CoversBuildIdentity(t *testing.T) {
+	env := map[string]string{"API_KEY": "supersecretvalue"}
+	if scanCacheSalt("build-a", env) == scanCacheSalt("build-b", env) {
+		t.Error("expected different builds to produce different cache salts")
+	}
+
+	identity, err := executableIdentity()
+	if err != nil {
+		t.Fatalf("executableIdentity() error: %v", err)
+	}
+	if again, _ := executableIdentity(); again != identity || identity == "" {
+		t.Errorf("executableIdentity() = %q then %q, want a stable non-empty identity", identity, again)
+	}
+}
+
+func Test_ScanCache_CorruptFileIgnored(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "scan-cache.json")
+	if err := os.WriteFile(path, []byte("{not json"), 0o600); err != nil {
+		t.Fatalf("failed to write corrupt cache: %v", err)
+	}
+
+	cache := loadScanCache(path, nil)
+	blob := StagedBlob{OID: "abc", Size: 42}
+	if _, ok := cache.get("app.py", blob); ok {
+		t.Error("expected miss on corrupt cache")
+	}
+	cache.put("app.py", blob, fileIssues{})
+	cache.save()
+
+	if _, ok := loadScanCache(path, nil).get("app.py", blob); !ok {
+		t.Error("expected corrupt cache to be replaced on save")
+	}
+}
+
+func Test_ScanCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "scan-cache.json")
+
+	cache := loadScanCache(path, nil)
+	for i := 0; i < MaxScanCacheEntries+10; i++ {
+		cache.put(fmt.Sprintf("file%d.py", i), StagedBlob{OID: "abc", Size: 42}, fileIssues{})
+	}
+	// Touch the oldest entry so it survives eviction
+	if _, ok := cache.get("file0.py", StagedBlob{OID: "abc", Size: 42}); !ok {
+		t.Fatal("expected hit before save")
+	}
+	cache.save()
+
+	reloaded := loadScanCache(path, nil)
+	if len(reloaded.entries) != MaxScanCacheEntries {
+		t.Errorf("cache entries = %d, want %d", len(reloaded.entries), MaxScanCacheEntries)
+	}
+	if _, ok := reloaded.get("file0.py", StagedBlob{OID: "abc", Size: 42}); !ok {
+		t.Error("expected recently used entry to survive eviction")
+	}
+	if _, ok := reloaded.get("file1.py", StagedBlob{OID: "abc", Size: 42}); ok {
+		t.Error("expected least recently used entry to be evicted")
+	}
+}
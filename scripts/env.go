@@ -1,7 +1,6 @@
 package main
 
 import (
-	"bufio"
 	"os"
 	"strings"
 )
@@ -11,18 +10,20 @@ import (
 // Handles: comments (#), empty lines, quoted values (single/double),
 // multiple equals signs, whitespace trimming.
 func ParseEnvFile(envPath string) map[string]string {
-	envVars := make(map[string]string)
-
-	// Open the file, return empty map if it doesn't exist or can't be read
-	file, err := os.Open(envPath)
+	// Read the whole file at once, return empty map if it doesn't exist or can't be read
+	data, err := os.ReadFile(envPath)
 	if err != nil {
-		return envVars
+		return make(map[string]string)
 	}
-	defer func() { _ = file.Close() }()
 
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
+	// Size the map for one entry per line so it never grows while parsing
+	content := string(data)
+	envVars := make(map[string]string, strings.Count(content, "\n")+1)
+
+	for rest := content; rest != ""; {
+		var line string
+		line, rest, _ = strings.Cut(rest, "\n")
+		line = strings.TrimSpace(line)
 
 		// Skip empty lines and comments
 		if line == "" || strings.HasPrefix(line, "#") {
@@ -30,13 +31,13 @@ func ParseEnvFile(envPath string) map[string]string {
 		}
 
 		// Split on first '=' only
-		parts := strings.SplitN(line, "=", 2)
-		if len(parts) != 2 {
+		key, value, found := strings.Cut(line, "=")
+		if !found {
 			continue
 		}
 
-		key := strings.TrimSpace(parts[0])
-		value := strings.TrimSpace(parts[1])
+		key = strings.TrimSpace(key)
+		value = strings.TrimSpace(value)
 
 		// Strip matching surrounding quotes
 		if len(value) >= 2 {
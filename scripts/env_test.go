@@ -1,8 +1,10 @@
 package main
 
 import (
+	"fmt"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 )
 
@@ -192,6 +194,17 @@ func Test_ParseEnvFile_UnicodeError(t *testing.T) {
 	assertMapLen(t, got, 0)
 }
 
+func Test_ParseEnvFile_LongLine(t *testing.T) {
+	dir := t.TempDir()
+	longValue := strings.Repeat("x", 100*1024)
+	path := writeEnvFile(t, dir, ".env", "LONG="+longValue+"\nAFTER=value_after_long_line\n")
+
+	got := ParseEnvFile(path)
+	assertMapLen(t, got, 2)
+	assertMapValue(t, got, "LONG", longValue)
+	assertMapValue(t, got, "AFTER", "value_after_long_line")
+}
+
 func Test_FilterEnvValues_Cases(t *testing.T) {
 	tests := []struct {
 		name       string
@@ -293,3 +306,20 @@ func Test_FilterEnvValues_Cases(t *testing.T) {
 		})
 	}
 }
+
+func Benchmark_ParseEnvFile(b *testing.B) {
+	var content strings.Builder
+	content.WriteString("# Application settings\n\n")
+	for i := 0; i < 200; i++ {
+		fmt.Fprintf(&content, "SETTING_%d=\"value_%d_abcdefghijklmnop\"\n", i, i)
+	}
+	path := filepath.Join(b.TempDir(), ".env")
+	if err := os.WriteFile(path, []byte(content.String()), 0644); err != nil {
+		b.Fatalf("failed to write benchmark env file: %v", err)
+	}
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		ParseEnvFile(path)
+	}
+}
@@ -8,12 +8,8 @@ import (
 // IsEnvFile checks if a file path refers to an environment file that should be skipped.
 // Handles both Unix (/) and Windows (\) path separators.
 func IsEnvFile(filePath string) bool {
-	// Replace all backslashes with forward slashes for consistent handling
-	normalizedPath := strings.ReplaceAll(filePath, "\\", "/")
-
-	// Get the filename (last component after splitting on /)
-	parts := strings.Split(normalizedPath, "/")
-	filename := parts[len(parts)-1]
+	// Get the filename (everything after the last / or \)
+	filename := filePath[strings.LastIndexAny(filePath, `/\`)+1:]
 
 	// Check if filename is in the envFileNames set
 	if _, exists := envFileNames[filename]; exists {
@@ -31,18 +27,19 @@ func IsEnvFile(filePath string) bool {
 // IsBinaryFile checks if a file has a binary extension that should be skipped.
 // Case-insensitive matching. Handles compound extensions like .min.js.
 func IsBinaryFile(filePath string) bool {
-	// Lowercase the full path for case-insensitive matching
-	lowerPath := strings.ToLower(filePath)
-
-	// Check single-dot extensions using filepath.Ext
-	ext := filepath.Ext(lowerPath)
+	// Check single-dot extensions using filepath.Ext, lowercasing only the extension
+	ext := strings.ToLower(filepath.Ext(filePath))
 	if _, exists := binaryExtensions[ext]; exists {
 		return true
 	}
 
-	// Check compound extensions
+	// Check compound extensions; the full path is only lowercased when the final
+	// extension could end one of them (e.g. ".js" for ".min.js")
+	if ext == "" {
+		return false
+	}
 	for _, compoundExt := range compoundBinaryExtensions {
-		if strings.HasSuffix(lowerPath, compoundExt) {
+		if strings.HasSuffix(compoundExt, ext) && strings.HasSuffix(strings.ToLower(filePath), compoundExt) {
 			return true
 		}
 	}
@@ -188,6 +188,8 @@ func Test_IsBinaryFile_Cases(t *testing.T) {
 		{name: "txt document", filePath: "document.txt", want: false},
 		{name: "markdown readme", filePath: "README.md", want: false},
 		{name: "python script with path", filePath: "/home/user/scripts/script.py", want: false},
+		{name: "no extension", filePath: "scripts/Makefile", want: false},
+		{name: "dotted directory no extension", filePath: "dist.min.js/Makefile", want: false},
 	}
 
 	for _, tt := range tests {
@@ -211,6 +213,8 @@ func Test_IsBinaryFile_CaseInsensitive(t *testing.T) {
 		{name: "uppercase ZIP", filePath: "archive.ZIP", want: true},
 		{name: "uppercase JPG", filePath: "photo.JPG", want: true},
 		{name: "mixed case Jpg", filePath: "photo.Jpg", want: true},
+		{name: "uppercase compound MIN.JS", filePath: "dist/app.MIN.JS", want: true},
+		{name: "mixed case compound Min.Css", filePath: "dist/style.Min.Css", want: true},
 	}
 
 	for _, tt := range tests {
@@ -222,3 +226,21 @@ func Test_IsBinaryFile_CaseInsensitive(t *testing.T) {
 		})
 	}
 }
+
+func Benchmark_IsBinaryFile(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		IsBinaryFile("src/Components/UserProfile/Index.tsx")
+	}
+}
+
+func Benchmark_IsBinaryFile_NoExtension(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		IsBinaryFile("src/Components/UserProfile/Makefile")
+	}
+}
+
+func Benchmark_IsEnvFile(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		IsEnvFile("src/Components/UserProfile/Index.tsx")
+	}
+}
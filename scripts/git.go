@@ -1,12 +1,25 @@
 package main
 
 import (
+	"bufio"
 	"context"
+	"errors"
+	"fmt"
+	"io"
 	"os/exec"
 	"regexp"
+	"strconv"
 	"strings"
+	"time"
 )
 
+// ErrStagedContentTooLarge is returned when a staged blob exceeds MaxFileSize.
+// The blob is skipped without being held in memory.
+var ErrStagedContentTooLarge = errors.New("staged content exceeds maximum file size")
+
+// ErrStagedBlobMissing is returned when a path has no staged blob (e.g. a staged deletion).
+var ErrStagedBlobMissing = errors.New("no staged blob for path")
+
 var (
 	// Pre-compiled regexes for git commit detection
 	commandSeparatorRegex = regexp.MustCompile(`[;&|]+`)
@@ -17,6 +30,12 @@ var (
 // IsGitCommitCommand checks if a command string contains a git commit operation.
 // Splits command by separators and checks each subcommand.
 func IsGitCommitCommand(command string) bool {
+	// Most Bash commands never mention commit; skip the regex work for them.
+	// The letters of "commit" have no non-ASCII case folds, so lowercasing is exact.
+	if !strings.Contains(strings.ToLower(command), "commit") {
+		return false
+	}
+
 	// Split command on separators: ; & |
 	subcommands := commandSeparatorRegex.Split(command, -1)
 
@@ -40,12 +59,14 @@ func IsGitCommitCommand(command string) bool {
 	return false
 }
 
-// GetStagedFiles returns the list of staged file paths via "git diff --cached --name-only".
-func GetStagedFiles() ([]string, error) {
+// GetStagedFiles returns the list of staged file paths in the repository at dir
+// via "git diff --cached --name-only".
+func GetStagedFiles(dir string) ([]string, error) {
 	ctx, cancel := context.WithTimeout(context.Background(), SubprocessTimeout)
 	defer cancel()
 
 	cmd := exec.CommandContext(ctx, "git", "diff", "--cached", "--name-only")
+	cmd.Dir = dir
 	output, err := cmd.Output()
 	if err != nil {
 		return nil, err
@@ -64,16 +85,186 @@ func GetStagedFiles() ([]string, error) {
 	return files, nil
 }
 
-// GetStagedContent reads file content from the git staging area via "git show :filepath".
-func GetStagedContent(filePath string) (string, error) {
+// GetStagedContent reads file content from the staging area of the repository at dir,
+// equivalent to "git show :filepath". It is a one-shot StagedContentReader; use a
+// StagedContentReader directly to read several files through one git process.
+func GetStagedContent(dir, filePath string) (string, error) {
+	reader, err := NewStagedContentReader(dir)
+	if err != nil {
+		return "", err
+	}
+
+	content, _, err := reader.Read(filePath)
+	if closeErr := reader.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		return "", err
+	}
+
+	return content, nil
+}
+
+// StagedBlob identifies the blob staged for a file.
+type StagedBlob struct {
+	OID  string
+	Size int
+}
+
+// GetStagedBlobs looks up the staged blob of every file path in the repository at dir with
+// a single "git cat-file --batch-check" call, so sizes are known before any content is read.
+// Paths with no staged blob (e.g. a staged deletion) are omitted from the result.
+func GetStagedBlobs(dir string, filePaths []string) (map[string]StagedBlob, error) {
+	blobs := make(map[string]StagedBlob, len(filePaths))
+	if len(filePaths) == 0 {
+		return blobs, nil
+	}
+
 	ctx, cancel := context.WithTimeout(context.Background(), SubprocessTimeout)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "git", "show", ":"+filePath)
+	var input strings.Builder
+	for _, filePath := range filePaths {
+		input.WriteString(":" + filePath + "\n")
+	}
+
+	cmd := exec.CommandContext(ctx, "git", "cat-file", "--batch-check")
+	cmd.Dir = dir
+	cmd.Stdin = strings.NewReader(input.String())
 	output, err := cmd.Output()
 	if err != nil {
-		return "", err
+		return nil, err
+	}
+
+	// One reply line per requested path, in order: "<oid> <type> <size>" or "<object> missing"
+	lines := strings.Split(strings.TrimSuffix(string(output), "\n"), "\n")
+	if len(lines) != len(filePaths) {
+		return nil, fmt.Errorf("git cat-file --batch-check: got %d replies for %d paths", len(lines), len(filePaths))
+	}
+	for i, line := range lines {
+		fields := strings.Fields(line)
+		if len(fields) != 3 {
+			continue
+		}
+		size, err := strconv.Atoi(fields[2])
+		if err != nil {
+			continue
+		}
+		blobs[filePaths[i]] = StagedBlob{OID: fields[0], Size: size}
+	}
+
+	return blobs, nil
+}
+
+// StagedContentReader reads file content from the git staging area through a single
+// long-lived "git cat-file --batch" process, instead of starting "git show" once per file.
+// The process lives for the whole scan, so SubprocessTimeout bounds each Read and Close
+// rather than the session; on timeout git is killed and every later call fails.
+type StagedContentReader struct {
+	cmd    *exec.Cmd
+	stdin  io.WriteCloser
+	stdout *bufio.Reader
+}
+
+// NewStagedContentReader starts the "git cat-file --batch" process in the repository at dir.
+// The caller must call Close when done.
+func NewStagedContentReader(dir string) (*StagedContentReader, error) {
+	cmd := exec.Command("git", "cat-file", "--batch")
+	cmd.Dir = dir
+	stdin, err := cmd.StdinPipe()
+	if err != nil {
+		return nil, err
+	}
+	stdout, err := cmd.StdoutPipe()
+	if err != nil {
+		return nil, err
+	}
+	if err := cmd.Start(); err != nil {
+		return nil, err
+	}
+
+	return &StagedContentReader{
+		cmd:    cmd,
+		stdin:  stdin,
+		stdout: bufio.NewReader(stdout),
+	}, nil
+}
+
+// deadline kills the git process if the calling operation runs past SubprocessTimeout.
+// The caller must stop the returned timer when done.
+func (r *StagedContentReader) deadline() *time.Timer {
+	return time.AfterFunc(SubprocessTimeout, func() { _ = r.cmd.Process.Kill() })
+}
+
+// Read returns the staged content of filePath, equivalent to "git show :filepath",
+// along with the blob it was read from. A path with no staged blob (e.g. a staged deletion)
+// returns ErrStagedBlobMissing, and a blob larger than MaxFileSize is discarded unread and
+// returns ErrStagedContentTooLarge; either way the reader stays usable for further paths.
+// Any other error means the git process or its output is broken and the reader is unusable.
+func (r *StagedContentReader) Read(filePath string) (string, StagedBlob, error) {
+	timer := r.deadline()
+	defer timer.Stop()
+
+	if _, err := io.WriteString(r.stdin, ":"+filePath+"\n"); err != nil {
+		return "", StagedBlob{}, err
+	}
+
+	// Response header: "<oid> <type> <size>\n", or "<object> missing\n" on failure.
+	header, err := r.stdout.ReadString('\n')
+	if err != nil {
+		return "", StagedBlob{}, err
+	}
+	header = strings.TrimSuffix(header, "\n")
+	if strings.HasSuffix(header, " missing") {
+		return "", StagedBlob{}, ErrStagedBlobMissing
+	}
+	fields := strings.Fields(header)
+	if len(fields) != 3 {
+		return "", StagedBlob{}, fmt.Errorf("git cat-file: %s", header)
+	}
+	size, err := strconv.Atoi(fields[2])
+	if err != nil {
+		return "", StagedBlob{}, fmt.Errorf("git cat-file: %s", header)
+	}
+	blob := StagedBlob{OID: fields[0], Size: size}
+
+	// Skip oversized content and its newline terminator without buffering it
+	if size > MaxFileSize {
+		if _, err := r.stdout.Discard(size + 1); err != nil {
+			return "", StagedBlob{}, err
+		}
+		return "", blob, ErrStagedContentTooLarge
 	}
 
-	return string(output), nil
+	// Copy straight from the read buffer into the string's backing buffer, so the blob is
+	// held in memory once: converting a []byte would copy it again, and io.CopyN would
+	// stage it through a temporary buffer of up to 32KB per file.
+	var content strings.Builder
+	content.Grow(size)
+	for remaining := size; remaining > 0; {
+		chunk, err := r.stdout.Peek(min(remaining, r.stdout.Size()))
+		if err != nil {
+			return "", StagedBlob{}, err
+		}
+		content.Write(chunk)
+		_, _ = r.stdout.Discard(len(chunk))
+		remaining -= len(chunk)
+	}
+
+	// Content is followed by a single newline terminator.
+	if _, err := r.stdout.Discard(1); err != nil {
+		return "", StagedBlob{}, err
+	}
+
+	return content.String(), blob, nil
+}
+
+// Close stops the "git cat-file --batch" process.
+// An error means git did not exit cleanly, so content read from it may be incomplete.
+func (r *StagedContentReader) Close() error {
+	timer := r.deadline()
+	defer timer.Stop()
+
+	_ = r.stdin.Close()
+	return r.cmd.Wait()
 }
@@ -1,6 +1,11 @@
 package main
 
-import "testing"
+import (
+	"errors"
+	"reflect"
+	"strings"
+	"testing"
+)
 
 // ---------------------------------------------------------------------------
 // TestIsGitCommitCommand
@@ -194,6 +199,188 @@ func Test_IsGitCommitCommand_CompoundCommands(t *testing.T) {
 	}
 }
 
+// ---------------------------------------------------------------------------
+// Staged content access (run against a temporary repo, not the working directory)
+// ---------------------------------------------------------------------------
+
+func Test_GetStagedFiles_UsesDir(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "b.txt", "second file\n")
+	writeTestFile(t, dir, "sub/a.txt", "first file\n")
+	gitAdd(t, dir, "b.txt")
+	gitAdd(t, dir, "sub/a.txt")
+
+	got, err := GetStagedFiles(dir)
+	if err != nil {
+		t.Fatalf("GetStagedFiles(%q) error: %v", dir, err)
+	}
+	want := []string{"b.txt", "sub/a.txt"}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("GetStagedFiles(%q) = %v, want %v", dir, got, want)
+	}
+}
+
+func Test_GetStagedFiles_NotARepo(t *testing.T) {
+	if _, err := GetStagedFiles(t.TempDir()); err == nil {
+		t.Error("expected error outside a git repository")
+	}
+}
+
+func Test_GetStagedBlobs_SizesAndMissing(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "a.txt", "hello world\n")
+	gitAdd(t, dir, "a.txt")
+
+	blobs, err := GetStagedBlobs(dir, []string{"a.txt", "missing.txt"})
+	if err != nil {
+		t.Fatalf("GetStagedBlobs error: %v", err)
+	}
+	blob, ok := blobs["a.txt"]
+	if !ok {
+		t.Fatal("expected blob for a.txt")
+	}
+	if blob.Size != len("hello world\n") || len(blob.OID) < 40 {
+		t.Errorf("blob = %+v, want size %d and a full OID", blob, len("hello world\n"))
+	}
+	if _, ok := blobs["missing.txt"]; ok {
+		t.Error("expected missing.txt to be omitted")
+	}
+}
+
+func Test_StagedContentReader_Read(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "a.txt", "staged content\n")
+	writeTestFile(t, dir, "b.txt", "")
+	gitAdd(t, dir, "a.txt")
+	gitAdd(t, dir, "b.txt")
+
+	// Unstaged edits must not be visible
+	writeTestFile(t, dir, "a.txt", "working tree content\n")
+
+	blobs, err := GetStagedBlobs(dir, []string{"a.txt"})
+	if err != nil {
+		t.Fatalf("GetStagedBlobs error: %v", err)
+	}
+
+	reader, err := NewStagedContentReader(dir)
+	if err != nil {
+		t.Fatalf("NewStagedContentReader error: %v", err)
+	}
+	defer func() { _ = reader.Close() }()
+
+	content, blob, err := reader.Read("a.txt")
+	if err != nil {
+		t.Fatalf("Read(a.txt) error: %v", err)
+	}
+	if content != "staged content\n" {
+		t.Errorf("Read(a.txt) = %q, want staged content", content)
+	}
+	if blob != blobs["a.txt"] {
+		t.Errorf("Read(a.txt) blob = %+v, want %+v", blob, blobs["a.txt"])
+	}
+
+	// A missing path returns ErrStagedBlobMissing and leaves the reader usable
+	if _, _, err := reader.Read("missing.txt"); !errors.Is(err, ErrStagedBlobMissing) {
+		t.Errorf("Read(missing.txt) error = %v, want ErrStagedBlobMissing", err)
+	}
+	content, _, err = reader.Read("b.txt")
+	if err != nil || content != "" {
+		t.Errorf("Read(b.txt) = %q, %v; want empty content", content, err)
+	}
+}
+
+func Test_GetStagedContent_UsesDir(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "a.txt", "staged content\n")
+	gitAdd(t, dir, "a.txt")
+
+	got, err := GetStagedContent(dir, "a.txt")
+	if err != nil {
+		t.Fatalf("GetStagedContent error: %v", err)
+	}
+	if got != "staged content\n" {
+		t.Errorf("GetStagedContent = %q, want %q", got, "staged content\n")
+	}
+}
+
+func Test_StagedContentReader_DeadProcessFails(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "a.txt", "staged content\n")
+	gitAdd(t, dir, "a.txt")
+
+	reader, err := NewStagedContentReader(dir)
+	if err != nil {
+		t.Fatalf("NewStagedContentReader error: %v", err)
+	}
+	if err := reader.cmd.Process.Kill(); err != nil {
+		t.Fatalf("failed to kill git: %v", err)
+	}
+
+	_, _, err = reader.Read("a.txt")
+	if err == nil || errors.Is(err, ErrStagedBlobMissing) {
+		t.Errorf("Read() after git died error = %v, want a read failure", err)
+	}
+	if err := reader.Close(); err == nil {
+		t.Error("Close() after git died should report the failure")
+	}
+}
+
+func Test_StagedContentReader_ReadSpansBuffer(t *testing.T) {
+	dir := setupGitRepo(t)
+	large := strings.Repeat("0123456789abcdef", 10000) // larger than the read buffer
+	writeTestFile(t, dir, "large.txt", large)
+	writeTestFile(t, dir, "after.txt", "after large file\n")
+	gitAdd(t, dir, "large.txt")
+	gitAdd(t, dir, "after.txt")
+
+	reader, err := NewStagedContentReader(dir)
+	if err != nil {
+		t.Fatalf("NewStagedContentReader error: %v", err)
+	}
+	defer func() { _ = reader.Close() }()
+
+	content, _, err := reader.Read("large.txt")
+	if err != nil || content != large {
+		t.Errorf("Read(large.txt) = %d bytes, %v; want %d bytes", len(content), err, len(large))
+	}
+	content, _, err = reader.Read("after.txt")
+	if err != nil || content != "after large file\n" {
+		t.Errorf("Read(after.txt) = %q, %v", content, err)
+	}
+}
+
+func Test_StagedContent_OversizedNotBuffered(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "huge.txt", strings.Repeat("a", MaxFileSize+1))
+	writeTestFile(t, dir, "small.txt", "small file content\n")
+	gitAdd(t, dir, "huge.txt")
+	gitAdd(t, dir, "small.txt")
+
+	if _, err := GetStagedContent(dir, "huge.txt"); !errors.Is(err, ErrStagedContentTooLarge) {
+		t.Errorf("GetStagedContent(huge.txt) error = %v, want ErrStagedContentTooLarge", err)
+	}
+
+	reader, err := NewStagedContentReader(dir)
+	if err != nil {
+		t.Fatalf("NewStagedContentReader error: %v", err)
+	}
+	defer func() { _ = reader.Close() }()
+
+	content, blob, err := reader.Read("huge.txt")
+	if !errors.Is(err, ErrStagedContentTooLarge) {
+		t.Errorf("Read(huge.txt) error = %v, want ErrStagedContentTooLarge", err)
+	}
+	if content != "" || blob.Size != MaxFileSize+1 {
+		t.Errorf("Read(huge.txt) = %d bytes, blob %+v; want no content and the blob size", len(content), blob)
+	}
+
+	// The oversized blob must be fully drained from the stream
+	content, _, err = reader.Read("small.txt")
+	if err != nil || content != "small file content\n" {
+		t.Errorf("Read(small.txt) after oversized blob = %q, %v", content, err)
+	}
+}
+
 // ---------------------------------------------------------------------------
 // Benchmarks
 // ---------------------------------------------------------------------------
@@ -2,11 +2,15 @@ package main
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 )
 
 // HookInput represents the JSON input received from Claude Code via stdin.
@@ -35,8 +39,13 @@ type hookSpecificOutput struct {
 func main() {
 	var input HookInput
 
-	// Parse JSON input from stdin
-	if err := json.NewDecoder(os.Stdin).Decode(&input); err != nil {
+	// Read stdin in one go and parse it; the payload is a single small JSON object
+	data, err := io.ReadAll(os.Stdin)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "SECURITY: Hook failed to read input: %v\n", err)
+		os.Exit(ExitBlocked)
+	}
+	if err := json.Unmarshal(data, &input); err != nil {
 		fmt.Fprintf(os.Stderr, "SECURITY: Hook failed to parse input: %v\n", err)
 		os.Exit(ExitBlocked)
 	}
@@ -59,10 +68,8 @@ func main() {
 	}
 
 	// Get project root from environment or fallback to current directory
-	projectDir := os.Getenv("CLAUDE_PROJECT_DIR")
-	projectRoot := projectDir
+	projectRoot := os.Getenv("CLAUDE_PROJECT_DIR")
 	if projectRoot == "" {
-		var err error
 		projectRoot, err = os.Getwd()
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "SECURITY: Failed to get working directory: %v\n", err)
@@ -70,20 +77,6 @@ func main() {
 		}
 	}
 
-	// Change to project root if CLAUDE_PROJECT_DIR was set
-	if projectDir != "" {
-		originalCwd, err := os.Getwd()
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "SECURITY: Failed to get current directory: %v\n", err)
-			os.Exit(ExitBlocked)
-		}
-		if err := os.Chdir(projectRoot); err != nil {
-			fmt.Fprintf(os.Stderr, "SECURITY: Failed to change directory: %v\n", err)
-			os.Exit(ExitBlocked)
-		}
-		defer func() { _ = os.Chdir(originalCwd) }()
-	}
-
 	runSecretCheck(projectRoot)
 }
 
@@ -95,7 +88,7 @@ func runSecretCheck(projectRoot string) {
 	secretEnvValues := FilterEnvValues(envVars)
 
 	// Get staged files
-	stagedFiles, err := GetStagedFiles()
+	stagedFiles, err := GetStagedFiles(projectRoot)
 	if err != nil {
 		fmt.Fprintf(os.Stderr, "SECURITY: Failed to get staged files: %v\n", err)
 		os.Exit(ExitBlocked)
@@ -106,50 +99,46 @@ func runSecretCheck(projectRoot string) {
 		os.Exit(ExitSuccess)
 	}
 
-	// Compile environment value patterns once for all files
-	envPatterns := CompileEnvPatterns(secretEnvValues)
-
-	// Collect all issues
-	var allPatternIssues []string
-	var allEnvIssues []string
-
-	// Sort staged files for deterministic order
-	sort.Strings(stagedFiles)
+	// Prepare environment value matchers once for all files
+	envMatchers := newEnvMatchers(secretEnvValues)
 
+	// Keep only files worth scanning
+	var scanPaths []string
 	for _, filePath := range stagedFiles {
-		// Skip binary files
-		if IsBinaryFile(filePath) {
+		// Skip binary files and .env files
+		if IsBinaryFile(filePath) || IsEnvFile(filePath) {
 			continue
 		}
+		scanPaths = append(scanPaths, filePath)
+	}
 
-		// Skip .env files
-		if IsEnvFile(filePath) {
-			continue
-		}
+	// Nothing left to scan (e.g. only binary or .env files are staged)
+	if len(scanPaths) == 0 {
+		os.Exit(ExitSuccess)
+	}
 
-		// Get file content from staging area
-		content, err := GetStagedContent(filePath)
-		if err != nil {
-			// Skip file if we can't read it
-			continue
-		}
+	// Look up staged blob sizes before reading any content
+	blobs, err := GetStagedBlobs(projectRoot, scanPaths)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "SECURITY: Failed to inspect staged files: %v\n", err)
+		os.Exit(ExitBlocked)
+	}
 
-		// Skip oversized files
-		if len(content) > MaxFileSize {
-			fmt.Fprintf(os.Stderr, "Warning: Skipping oversized staged content %s\n", filePath)
-			continue
-		}
+	// Reuse results for blobs scanned by earlier runs
+	cache := loadScanCache(scanCachePath(), secretEnvValues)
 
-		// Skip very small files
-		if len(content) < 10 {
-			continue
-		}
+	// Read staged content through one git process, started only if some blob misses the cache
+	openReader := func() (*StagedContentReader, error) {
+		return NewStagedContentReader(projectRoot)
+	}
 
-		// Check file for secrets
-		patternIssues, envIssues := CheckFileForSecrets(filePath, content, envPatterns)
-		allPatternIssues = append(allPatternIssues, patternIssues...)
-		allEnvIssues = append(allEnvIssues, envIssues...)
+	allPatternIssues, allEnvIssues, err := scanStagedFiles(openReader, scanPaths, blobs, envMatchers, cache)
+	if err != nil {
+		// A file that could not be read was not scanned; fail closed
+		fmt.Fprintf(os.Stderr, "SECURITY: Failed to read staged content: %v\n", err)
+		os.Exit(ExitBlocked)
 	}
+	cache.save()
 
 	// If secrets were found, deny the operation
 	if len(allPatternIssues) > 0 || len(allEnvIssues) > 0 {
@@ -161,6 +150,139 @@ func runSecretCheck(projectRoot string) {
 	os.Exit(ExitSuccess)
 }
 
+// stagedFile is a staged file's path and content, queued for scanning.
+type stagedFile struct {
+	path    string
+	blob    StagedBlob
+	content string
+}
+
+// fileIssues holds the issues found in one staged file.
+type fileIssues struct {
+	patternIssues []string
+	envIssues     []string
+}
+
+// scanStagedFiles reads each staged file whose blob size is in range and scans them concurrently.
+// Reading stays sequential because the cat-file protocol is; scanning fans out
+// across up to MaxScanWorkers goroutines. Blobs already in the cache are neither read nor scanned,
+// and the reader is opened with openReader on the first cache miss, so a fully cached run
+// starts no git process for content. A read error other than a missing or oversized blob
+// stops the scan and is returned, since the files after it would go unscanned, as is an
+// error closing the reader.
+func scanStagedFiles(openReader func() (*StagedContentReader, error), filePaths []string, blobs map[string]StagedBlob, envMatchers []envMatcher, cache *scanCache) ([]string, []string, error) {
+	files := make(chan stagedFile)
+	results := make(chan fileIssues)
+
+	// No more workers than files: a single-file commit scans on one goroutine
+	workers := min(MaxScanWorkers, runtime.NumCPU(), len(filePaths))
+
+	var wg sync.WaitGroup
+	for i := 0; i < workers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for file := range files {
+				patternIssues, envIssues := checkContent(file.path, file.content, envMatchers)
+				issues := fileIssues{patternIssues: patternIssues, envIssues: envIssues}
+				cache.put(file.path, file.blob, issues)
+				results <- issues
+			}
+		}()
+	}
+
+	// Set by the reading goroutine before it finishes; read only after results is closed
+	var readErr error
+
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		defer close(files)
+
+		var reader *StagedContentReader
+		defer func() {
+			if reader == nil {
+				return
+			}
+			if err := reader.Close(); err != nil && readErr == nil {
+				readErr = err
+			}
+		}()
+
+		for _, filePath := range filePaths {
+			// Skip files with no staged blob (e.g. staged deletions)
+			blob, ok := blobs[filePath]
+			if !ok {
+				continue
+			}
+
+			// Skip oversized files without reading them
+			if blob.Size > MaxFileSize {
+				fmt.Fprintf(os.Stderr, "Warning: Skipping oversized staged content %s\n", filePath)
+				continue
+			}
+
+			// Skip very small files
+			if blob.Size < 10 {
+				continue
+			}
+
+			// Reuse the result of an earlier scan of the same blob
+			if issues, ok := cache.get(filePath, blob); ok {
+				results <- issues
+				continue
+			}
+
+			// Start the git process on the first blob that has to be read
+			if reader == nil {
+				var err error
+				if reader, err = openReader(); err != nil {
+					readErr = err
+					return
+				}
+			}
+
+			// Get file content from staging area
+			content, readBlob, err := reader.Read(filePath)
+			if errors.Is(err, ErrStagedContentTooLarge) {
+				// The index changed since the size lookup and the blob grew past the limit
+				fmt.Fprintf(os.Stderr, "Warning: Skipping oversized staged content %s\n", filePath)
+				continue
+			}
+			if errors.Is(err, ErrStagedBlobMissing) {
+				// The path was unstaged or deleted since the size lookup
+				continue
+			}
+			if err != nil {
+				readErr = fmt.Errorf("%s: %w", filePath, err)
+				return
+			}
+
+			// The index may have changed since the size lookup; the content read is authoritative
+			if len(content) < 10 {
+				continue
+			}
+
+			files <- stagedFile{path: filePath, blob: readBlob, content: content}
+		}
+	}()
+
+	go func() {
+		wg.Wait()
+		close(results)
+	}()
+
+	// Collect all issues
+	var allPatternIssues []string
+	var allEnvIssues []string
+	for result := range results {
+		allPatternIssues = append(allPatternIssues, result.patternIssues...)
+		allEnvIssues = append(allEnvIssues, result.envIssues...)
+	}
+
+	return allPatternIssues, allEnvIssues, readErr
+}
+
 // buildDenyOutput creates the JSON output for denying a git commit due to detected secrets.
 func buildDenyOutput(patternIssues, envIssues []string) string {
 	var reasonParts []string
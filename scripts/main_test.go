@@ -7,6 +7,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"reflect"
 	"runtime"
 	"strings"
 	"testing"
@@ -68,10 +69,12 @@ func runBinary(t *testing.T, stdin string, env ...string) (exitCode int, stdout
 	cmd.Stdout = &outBuf
 	cmd.Stderr = &errBuf
 
-	// Start with a clean environment, inheriting PATH for git access.
+	// Start with a clean environment, inheriting PATH for git access
+	// and isolating the scan cache per test.
 	baseEnv := []string{
 		"PATH=" + os.Getenv("PATH"),
 		"HOME=" + os.Getenv("HOME"),
+		scanCacheDirEnv + "=" + t.TempDir(),
 	}
 	cmd.Env = append(baseEnv, env...)
 
@@ -102,6 +105,7 @@ func runBinaryInDir(t *testing.T, dir string, stdin string, env ...string) (exit
 	baseEnv := []string{
 		"PATH=" + os.Getenv("PATH"),
 		"HOME=" + os.Getenv("HOME"),
+		scanCacheDirEnv + "=" + t.TempDir(),
 	}
 	cmd.Env = append(baseEnv, env...)
 
@@ -306,6 +310,10 @@ func Test_Main_InvalidJSON(t *testing.T) {
 			name:  "array instead of object",
 			stdin: `["Bash", "git commit"]`,
 		},
+		{
+			name:  "trailing data after object",
+			stdin: `{"tool_name":"Bash","tool_input":{"command":"git commit -m test"}} garbage`,
+		},
 	}
 
 	for _, tt := range tests {
@@ -786,6 +794,234 @@ func Test_Main_MultipleSecretsInMultipleFiles(t *testing.T) {
 	}
 }
 
+// ---------------------------------------------------------------------------
+// Test_Main_UnreadableStagedPathDoesNotHideLaterFiles - a staged deletion has no
+// blob to read; files after it must still be scanned
+// ---------------------------------------------------------------------------
+
+func Test_Main_UnreadableStagedPathDoesNotHideLaterFiles(t *testing.T) {
+	dir := setupGitRepo(t)
+
+	writeTestFile(t, dir, "a_removed.py", "def removed():\n    pass\n")
+	gitAdd(t, dir, "a_removed.py")
+	cmd := exec.Command("git", "commit", "-m", "initial")
+	cmd.Dir = dir
+	if out, err := cmd.CombinedOutput(); err != nil {
+		t.Fatalf("git commit failed: %v\n%s", err, out)
+	}
+
+	cmd = exec.Command("git", "rm", "-q", "a_removed.py")
+	cmd.Dir = dir
+	if out, err := cmd.CombinedOutput(); err != nil {
+		t.Fatalf("git rm failed: %v\n%s", err, out)
+	}
+
+	writeTestFile(t, dir, "b clean.py", "def hello():\n    print('world')\n")
+	gitAdd(t, dir, "b clean.py")
+
+	writeTestFile(t, dir, "c_secret.py", "key = 'sk-ant-"+strings.Repeat("x", 30)+"'")
+	gitAdd(t, dir, "c_secret.py")
+
+	exitCode, stdout, _ := runBinaryInDir(t, dir, gitCommitInput("test deletion"),
+		"CLAUDE_PROJECT_DIR="+dir,
+	)
+
+	if exitCode != 2 {
+		t.Errorf("expected exit code 2 (blocked by secret after deleted file), got %d", exitCode)
+	}
+
+	var output hookOutputJSON
+	if err := json.Unmarshal([]byte(stdout), &output); err != nil {
+		t.Fatalf("failed to parse stdout JSON: %v\nstdout was: %q", err, stdout)
+	}
+
+	if !strings.Contains(output.HookSpecificOutput.PermissionDecisionReason, "c_secret.py:1") {
+		t.Errorf("permissionDecisionReason should report c_secret.py:1, got: %q",
+			output.HookSpecificOutput.PermissionDecisionReason)
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Test_Main_ManyFilesAllReported - every secret-bearing file is reported when
+// files are scanned concurrently
+// ---------------------------------------------------------------------------
+
+func Test_Main_ManyFilesAllReported(t *testing.T) {
+	dir := setupGitRepo(t)
+
+	const fileCount = 24
+	for i := 0; i < fileCount; i++ {
+		name := fmt.Sprintf("pkg/file%02d.py", i)
+		content := "def hello():\n    print('world')\n"
+		if i%2 == 0 {
+			content = fmt.Sprintf("line1\nkey = 'sk-ant-%s'\n", strings.Repeat("x", 30))
+		}
+		writeTestFile(t, dir, name, content)
+		gitAdd(t, dir, name)
+	}
+
+	exitCode, stdout, _ := runBinaryInDir(t, dir, gitCommitInput("test many files"),
+		"CLAUDE_PROJECT_DIR="+dir,
+	)
+
+	if exitCode != 2 {
+		t.Errorf("expected exit code 2 for files with secrets, got %d", exitCode)
+	}
+
+	var output hookOutputJSON
+	if err := json.Unmarshal([]byte(stdout), &output); err != nil {
+		t.Fatalf("failed to parse stdout JSON: %v\nstdout was: %q", err, stdout)
+	}
+
+	reason := output.HookSpecificOutput.PermissionDecisionReason
+	for i := 0; i < fileCount; i++ {
+		issue := fmt.Sprintf("pkg/file%02d.py:2 - Found potential Anthropic API key", i)
+		if got := strings.Contains(reason, issue); got != (i%2 == 0) {
+			t.Errorf("reason contains %q = %v, want %v", issue, got, i%2 == 0)
+		}
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Test_Main_SkipsOversizedStagedContent - files over MaxFileSize are skipped
+// with a warning instead of scanned
+// ---------------------------------------------------------------------------
+
+func Test_Main_SkipsOversizedStagedContent(t *testing.T) {
+	dir := setupGitRepo(t)
+
+	secret := "key = 'sk-ant-" + strings.Repeat("x", 30) + "'\n"
+	writeTestFile(t, dir, "huge.txt", secret+strings.Repeat("a", MaxFileSize))
+	gitAdd(t, dir, "huge.txt")
+
+	exitCode, stdout, stderr := runBinaryInDir(t, dir, gitCommitInput("test oversized"),
+		"CLAUDE_PROJECT_DIR="+dir,
+	)
+
+	if exitCode != 0 {
+		t.Errorf("expected exit code 0 (oversized file skipped), got %d", exitCode)
+	}
+	if stdout != "" {
+		t.Errorf("expected empty stdout, got %q", stdout)
+	}
+	if !strings.Contains(stderr, "Skipping oversized staged content huge.txt") {
+		t.Errorf("expected oversized warning on stderr, got %q", stderr)
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Test_ScanStagedFiles_ReaderFailureIsReturned - once the shared git reader dies,
+// the remaining files cannot be scanned, so the scan must fail instead of skipping them
+// ---------------------------------------------------------------------------
+
+func Test_ScanStagedFiles_ReaderFailureIsReturned(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "secret.py", "key = 'sk-ant-"+strings.Repeat("x", 30)+"'\n")
+	gitAdd(t, dir, "secret.py")
+
+	paths := []string{"secret.py"}
+	blobs, err := GetStagedBlobs(dir, paths)
+	if err != nil {
+		t.Fatalf("GetStagedBlobs error: %v", err)
+	}
+	openReader := func() (*StagedContentReader, error) {
+		reader, err := NewStagedContentReader(dir)
+		if err != nil {
+			return nil, err
+		}
+		if err := reader.cmd.Process.Kill(); err != nil {
+			t.Errorf("failed to kill git: %v", err)
+		}
+		return reader, nil
+	}
+
+	_, _, err = scanStagedFiles(openReader, paths, blobs, nil, loadScanCache("", nil))
+	if err == nil {
+		t.Error("expected scanStagedFiles to return the read failure")
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Test_ScanStagedFiles_CachedRunStartsNoReader - when every blob is cached, no
+// git process is started to read staged content
+// ---------------------------------------------------------------------------
+
+func Test_ScanStagedFiles_CachedRunStartsNoReader(t *testing.T) {
+	dir := setupGitRepo(t)
+	writeTestFile(t, dir, "secret.py", "key = 'sk-ant-"+strings.Repeat("x", 30)+"'\n")
+	gitAdd(t, dir, "secret.py")
+
+	paths := []string{"secret.py"}
+	blobs, err := GetStagedBlobs(dir, paths)
+	if err != nil {
+		t.Fatalf("GetStagedBlobs error: %v", err)
+	}
+	cached := fileIssues{patternIssues: []string{"secret.py:1 - cached"}}
+	cache := loadScanCache("", nil)
+	cache.put("secret.py", blobs["secret.py"], cached)
+
+	openReader := func() (*StagedContentReader, error) {
+		t.Error("expected no reader to be opened for a fully cached scan")
+		return NewStagedContentReader(dir)
+	}
+
+	patternIssues, _, err := scanStagedFiles(openReader, paths, blobs, nil, cache)
+	if err != nil {
+		t.Fatalf("scanStagedFiles error: %v", err)
+	}
+	if !reflect.DeepEqual(patternIssues, cached.patternIssues) {
+		t.Errorf("pattern issues = %v, want %v", patternIssues, cached.patternIssues)
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Test_Main_CachedScanReportsSameIssues - a second run over unchanged staged content
+// is served from the scan cache and must report the same findings
+// ---------------------------------------------------------------------------
+
+func Test_Main_CachedScanReportsSameIssues(t *testing.T) {
+	dir := setupGitRepo(t)
+	cacheDir := t.TempDir()
+
+	writeTestFile(t, dir, "secret.py", "key = 'sk-ant-"+strings.Repeat("x", 30)+"'\n")
+	writeTestFile(t, dir, "clean.py", "def hello():\n    print('world')\n")
+	gitAdd(t, dir, "secret.py")
+	gitAdd(t, dir, "clean.py")
+
+	stdin := gitCommitInput("test cache")
+	firstCode, firstOut, _ := runBinaryInDir(t, dir, stdin,
+		"CLAUDE_PROJECT_DIR="+dir,
+		scanCacheDirEnv+"="+cacheDir,
+	)
+	if _, err := os.Stat(filepath.Join(cacheDir, "scan-cache.json")); err != nil {
+		t.Fatalf("expected scan cache to be written: %v", err)
+	}
+
+	secondCode, secondOut, _ := runBinaryInDir(t, dir, stdin,
+		"CLAUDE_PROJECT_DIR="+dir,
+		scanCacheDirEnv+"="+cacheDir,
+	)
+
+	if firstCode != 2 || secondCode != 2 {
+		t.Errorf("expected exit code 2 on both runs, got %d and %d", firstCode, secondCode)
+	}
+	if firstOut != secondOut {
+		t.Errorf("cached run output differs:\nfirst:  %s\nsecond: %s", firstOut, secondOut)
+	}
+
+	// Re-staging different content at the same path must miss the cache
+	writeTestFile(t, dir, "secret.py", "key = 'redacted'\n")
+	gitAdd(t, dir, "secret.py")
+
+	thirdCode, thirdOut, _ := runBinaryInDir(t, dir, gitCommitInput("test cache"),
+		"CLAUDE_PROJECT_DIR="+dir,
+		scanCacheDirEnv+"="+cacheDir,
+	)
+	if thirdCode != 0 {
+		t.Errorf("expected exit code 0 after removing the secret, got %d (stdout %q)", thirdCode, thirdOut)
+	}
+}
+
 // ---------------------------------------------------------------------------
 // Test_Main_MixedCleanAndSecretFiles - only secrets in some files should still block
 // ---------------------------------------------------------------------------
@@ -5,13 +5,15 @@ import (
 	"time"
 )
 
-// Exit codes for the security hook.
+// Exit codes and limits for the security hook.
 const (
-	ExitSuccess       = 0
-	ExitBlocked       = 2
-	MinSecretLength   = 8
-	MaxFileSize       = 10 * 1024 * 1024 // 10MB
-	SubprocessTimeout = 30 * time.Second
+	ExitSuccess         = 0
+	ExitBlocked         = 2
+	MinSecretLength     = 8
+	MaxFileSize         = 10 * 1024 * 1024 // 10MB
+	SubprocessTimeout   = 30 * time.Second
+	MaxScanWorkers      = 8
+	MaxScanCacheEntries = 1024
 )
 
 // SecretPattern represents a compiled regex pattern with its description.
@@ -93,6 +95,8 @@ var envFileNames = map[string]struct{}{
 }
 
 // secretPatterns contains all pre-compiled secret detection patterns.
+// Go's regexp package implements RE2 semantics: matching runs in time linear in the input
+// and never backtracks, so staged content cannot trigger catastrophic backtracking.
 var secretPatterns = []SecretPattern{
 	// Generic secrets
 	{regexp.MustCompile(`(?i)(secret|token)\s*[:=]\s*['"]?[a-zA-Z0-9_\-]{20,}`), "secret/token"},
@@ -138,3 +142,19 @@ var secretPatterns = []SecretPattern{
 	// Mailgun
 	{regexp.MustCompile(`key-[a-zA-Z0-9]{32}`), "Mailgun API key"},
 }
+
+// patternKeywords maps a secret pattern description to lowercase keywords, at least one of
+// which must appear in the content (case-insensitively) for that pattern to match. Patterns
+// without a literal prefix cost the regex engine a full NFA pass per file; checking for a
+// keyword first skips that pass on the common clean file.
+var patternKeywords = map[string][]string{
+	"secret/token":    {"secret", "token"},
+	"AWS credentials": {"aws_access_key_id", "aws_secret_access_key"},
+	"Bearer token":    {"bearer"},
+}
+
+// patternProbes maps a secret pattern description to a cheap check that content must pass
+// for that pattern to match. It covers prefix-less patterns with no keyword to filter on.
+var patternProbes = map[string]func(content string) bool{
+	"Discord bot token": hasDiscordTokenShape,
+}
@@ -1,6 +1,7 @@
 package main
 
 import (
+	"strings"
 	"testing"
 	"time"
 )
@@ -65,6 +66,39 @@ func Test_SecretPatterns_NonNilPatterns(t *testing.T) {
 	}
 }
 
+func Test_PatternKeywords_KnownDescriptions(t *testing.T) {
+	descriptions := make(map[string]struct{}, len(secretPatterns))
+	for _, sp := range secretPatterns {
+		descriptions[sp.Description] = struct{}{}
+	}
+
+	for desc, keywords := range patternKeywords {
+		t.Run(desc, func(t *testing.T) {
+			if _, ok := descriptions[desc]; !ok {
+				t.Errorf("patternKeywords key %q does not match any secretPatterns description", desc)
+			}
+			for _, kw := range keywords {
+				if kw == "" || kw != strings.ToLower(kw) || !isASCII(kw) {
+					t.Errorf("patternKeywords[%q] keyword %q must be non-empty lowercase ASCII", desc, kw)
+				}
+			}
+		})
+	}
+}
+
+func Test_PatternProbes_KnownDescriptions(t *testing.T) {
+	descriptions := make(map[string]struct{}, len(secretPatterns))
+	for _, sp := range secretPatterns {
+		descriptions[sp.Description] = struct{}{}
+	}
+
+	for desc := range patternProbes {
+		if _, ok := descriptions[desc]; !ok {
+			t.Errorf("patternProbes key %q does not match any secretPatterns description", desc)
+		}
+	}
+}
+
 func Test_Constants(t *testing.T) {
 	tests := []struct {
 		name string
@@ -106,3 +140,13 @@ func Test_Constants(t *testing.T) {
 		})
 	}
 }
+
+// isASCII reports whether s contains only ASCII bytes.
+func isASCII(s string) bool {
+	for i := 0; i < len(s); i++ {
+		if s[i] >= 0x80 {
+			return false
+		}
+	}
+	return true
+}
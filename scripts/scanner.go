@@ -3,6 +3,8 @@ package main
 import (
 	"fmt"
 	"regexp"
+	"regexp/syntax"
+	"sort"
 	"strings"
 )
 
@@ -17,6 +19,38 @@ func GetLineNumber(content string, position int) int {
 	return strings.Count(content[:position], "\n") + 1
 }
 
+// lineIndex resolves byte positions in content to 1-based line numbers by binary search over
+// the newline offsets. The offsets are collected on first use, so files without findings never
+// pay for them, and files with many findings avoid recounting newlines for every match.
+type lineIndex struct {
+	content  string
+	newlines []int
+	built    bool
+}
+
+// lineNumber returns the same result as GetLineNumber(content, position).
+func (li *lineIndex) lineNumber(position int) int {
+	if !li.built {
+		for pos := 0; ; {
+			i := strings.IndexByte(li.content[pos:], '\n')
+			if i < 0 {
+				break
+			}
+			li.newlines = append(li.newlines, pos+i)
+			pos += i + 1
+		}
+		li.built = true
+	}
+
+	if position > len(li.content) {
+		position = len(li.content)
+	}
+	if position < 0 {
+		position = 0
+	}
+	return sort.SearchInts(li.newlines, position) + 1
+}
+
 // CompileEnvPatterns creates word-boundary-wrapped compiled regexes for each env value.
 // Called once per scan, not per file.
 func CompileEnvPatterns(secretEnvValues map[string]string) map[string]*regexp.Regexp {
@@ -37,30 +71,246 @@ func CompileEnvPatterns(secretEnvValues map[string]string) map[string]*regexp.Re
 //	"filepath:linenum - Found potential description"
 //	"filepath:linenum - Found hardcoded value from .env key 'KEY'"
 func CheckFileForSecrets(filePath, content string, envPatterns map[string]*regexp.Regexp) ([]string, []string) {
+	return checkContent(filePath, content, prepareEnvMatchers(envPatterns))
+}
+
+// checkContent is CheckFileForSecrets with the env value patterns already prepared,
+// so a scan over many files prepares them only once.
+func checkContent(filePath, content string, envMatchers []envMatcher) ([]string, []string) {
 	var patternIssues []string
 	var envIssues []string
+	lines := lineIndex{content: content}
+
+	// The keyword prefilter compares ASCII case only, but (?i)s also matches U+017F (long s)
+	// and (?i)k matches U+212A (Kelvin sign), so content containing either skips the
+	// prefilter rather than miss a match.
+	prefilter := !strings.ContainsRune(content, '\u017f') && !strings.ContainsRune(content, '\u212a')
 
 	// Check against pre-compiled secret patterns
 	for _, pattern := range secretPatterns {
+		if keywords, ok := patternKeywords[pattern.Description]; ok && prefilter && !containsAnyFoldASCII(content, keywords) {
+			continue
+		}
+		if probe, ok := patternProbes[pattern.Description]; ok && !probe(content) {
+			continue
+		}
+
 		matches := pattern.Pattern.FindAllStringIndex(content, -1)
 		for _, match := range matches {
 			start := match[0]
-			lineNum := GetLineNumber(content, start)
+			lineNum := lines.lineNumber(start)
 			issue := fmt.Sprintf("%s:%d - Found potential %s", filePath, lineNum, pattern.Description)
 			patternIssues = append(patternIssues, issue)
 		}
 	}
 
 	// Check against environment value patterns
-	for key, pattern := range envPatterns {
-		matches := pattern.FindAllStringIndex(content, -1)
-		for _, match := range matches {
-			start := match[0]
-			lineNum := GetLineNumber(content, start)
-			issue := fmt.Sprintf("%s:%d - Found hardcoded value from .env key '%s'", filePath, lineNum, key)
+	for _, matcher := range envMatchers {
+		for _, start := range matcher.find(content) {
+			lineNum := lines.lineNumber(start)
+			issue := fmt.Sprintf("%s:%d - Found hardcoded value from .env key '%s'", filePath, lineNum, matcher.key)
 			envIssues = append(envIssues, issue)
 		}
 	}
 
 	return patternIssues, envIssues
 }
+
+// containsAnyFoldASCII reports whether s contains at least one of substrs, ignoring ASCII case.
+// Each substr must be non-empty lowercase ASCII. Unlike lowercasing s first, it never copies s.
+func containsAnyFoldASCII(s string, substrs []string) bool {
+	for _, substr := range substrs {
+		if containsFoldASCII(s, substr) {
+			return true
+		}
+	}
+	return false
+}
+
+// containsFoldASCII reports whether s contains substr, ignoring ASCII case.
+// substr must be non-empty lowercase ASCII.
+func containsFoldASCII(s, substr string) bool {
+	if len(substr) > len(s) {
+		return false
+	}
+
+	// Candidate starts are occurrences of either case of the first byte. Each case is
+	// searched with IndexByte and its next position kept, so neither is rescanned.
+	candidates := s[:len(s)-len(substr)+1]
+	lower := substr[0]
+	upper := lower
+	if 'a' <= lower && lower <= 'z' {
+		upper -= 'a' - 'A'
+	}
+	nextLower := strings.IndexByte(candidates, lower)
+	nextUpper := -1
+	if upper != lower {
+		nextUpper = strings.IndexByte(candidates, upper)
+	}
+
+	for nextLower >= 0 || nextUpper >= 0 {
+		var i int
+		if nextUpper < 0 || (nextLower >= 0 && nextLower < nextUpper) {
+			i = nextLower
+			nextLower = indexByteFrom(candidates, lower, i+1)
+		} else {
+			i = nextUpper
+			nextUpper = indexByteFrom(candidates, upper, i+1)
+		}
+		if hasPrefixFoldASCII(s[i:], substr) {
+			return true
+		}
+	}
+	return false
+}
+
+// indexByteFrom returns the index of the first c in s at or after from, or -1.
+func indexByteFrom(s string, c byte, from int) int {
+	if i := strings.IndexByte(s[from:], c); i >= 0 {
+		return from + i
+	}
+	return -1
+}
+
+// hasPrefixFoldASCII reports whether s starts with the lowercase ASCII prefix, ignoring ASCII case.
+func hasPrefixFoldASCII(s, prefix string) bool {
+	if len(s) < len(prefix) {
+		return false
+	}
+	for i := 0; i < len(prefix); i++ {
+		c := s[i]
+		if 'A' <= c && c <= 'Z' {
+			c += 'a' - 'A'
+		}
+		if c != prefix[i] {
+			return false
+		}
+	}
+	return true
+}
+
+// hasDiscordTokenShape reports whether content has the fixed skeleton of a Discord bot token:
+// a '.' preceded by 24 ASCII alphanumerics and followed by 6 token characters, a second '.'
+// and 27 more token characters. Every match of the Discord pattern has this shape.
+func hasDiscordTokenShape(content string) bool {
+	for pos := 0; ; {
+		i := strings.IndexByte(content[pos:], '.')
+		if i < 0 {
+			return false
+		}
+		dot := pos + i
+		pos = dot + 1
+
+		if dot < 24 || dot+35 > len(content) || content[dot+7] != '.' {
+			continue
+		}
+		if allBytes(content[dot-24:dot], isAlnumByte) &&
+			allBytes(content[dot+1:dot+7], isTokenByte) &&
+			allBytes(content[dot+8:dot+35], isTokenByte) {
+			return true
+		}
+	}
+}
+
+// allBytes reports whether every byte of s satisfies f.
+func allBytes(s string, f func(byte) bool) bool {
+	for i := 0; i < len(s); i++ {
+		if !f(s[i]) {
+			return false
+		}
+	}
+	return true
+}
+
+// isAlnumByte matches the class [A-Za-z\d].
+func isAlnumByte(c byte) bool {
+	return 'a' <= c && c <= 'z' || 'A' <= c && c <= 'Z' || '0' <= c && c <= '9'
+}
+
+// isTokenByte matches the class [A-Za-z\d_-].
+func isTokenByte(c byte) bool {
+	return isAlnumByte(c) || c == '_' || c == '-'
+}
+
+// envMatcher is an env value pattern prepared once per scan.
+// Patterns built by CompileEnvPatterns are a literal between two \b assertions; a leading \b
+// leaves the regex engine no literal prefix to skip ahead with, so those are searched with
+// strings.Index and the word boundaries are checked by hand. Any other pattern falls back to
+// the regex engine.
+type envMatcher struct {
+	key       string
+	pattern   *regexp.Regexp
+	literal   string
+	isLiteral bool
+}
+
+// prepareEnvMatchers resolves each env value pattern to an envMatcher.
+func prepareEnvMatchers(envPatterns map[string]*regexp.Regexp) []envMatcher {
+	matchers := make([]envMatcher, 0, len(envPatterns))
+	for key, pattern := range envPatterns {
+		literal, ok := envLiteral(pattern)
+		matchers = append(matchers, envMatcher{key: key, pattern: pattern, literal: literal, isLiteral: ok})
+	}
+	return matchers
+}
+
+// newEnvMatchers builds literal matchers for secretEnvValues directly. It is equivalent to
+// prepareEnvMatchers(CompileEnvPatterns(secretEnvValues)) but compiles no regex per value.
+func newEnvMatchers(secretEnvValues map[string]string) []envMatcher {
+	matchers := make([]envMatcher, 0, len(secretEnvValues))
+	for key, value := range secretEnvValues {
+		matchers = append(matchers, envMatcher{key: key, literal: value, isLiteral: true})
+	}
+	return matchers
+}
+
+// find returns the start offset of every non-overlapping match in content.
+func (m envMatcher) find(content string) []int {
+	var starts []int
+	if !m.isLiteral {
+		for _, match := range m.pattern.FindAllStringIndex(content, -1) {
+			starts = append(starts, match[0])
+		}
+		return starts
+	}
+
+	for pos := 0; pos <= len(content); {
+		i := strings.Index(content[pos:], m.literal)
+		if i < 0 {
+			break
+		}
+		start := pos + i
+		end := start + len(m.literal)
+		if isWordBoundary(content, start) && isWordBoundary(content, end) {
+			starts = append(starts, start)
+			pos = end
+		} else {
+			pos = start + 1
+		}
+	}
+	return starts
+}
+
+// envLiteral extracts the literal value from a pattern of the form \bLITERAL\b.
+func envLiteral(pattern *regexp.Regexp) (string, bool) {
+	re, err := syntax.Parse(pattern.String(), syntax.Perl)
+	if err != nil || re.Op != syntax.OpConcat || len(re.Sub) != 3 {
+		return "", false
+	}
+	head, body, tail := re.Sub[0], re.Sub[1], re.Sub[2]
+	if head.Op != syntax.OpWordBoundary || tail.Op != syntax.OpWordBoundary {
+		return "", false
+	}
+	if body.Op != syntax.OpLiteral || body.Flags&syntax.FoldCase != 0 {
+		return "", false
+	}
+	return string(body.Rune), true
+}
+
+// isWordBoundary reports whether \b holds at byte offset i of content.
+// Matches the regexp package: only ASCII word characters count, so a byte-level check is exact.
+func isWordBoundary(content string, i int) bool {
+	before := i > 0 && syntax.IsWordChar(rune(content[i-1]))
+	after := i < len(content) && syntax.IsWordChar(rune(content[i]))
+	return before != after
+}